@@ -1,5 +1,6 @@
 import yfinance as yf
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 from src.utils.config import load_config
@@ -14,36 +15,52 @@ raw_dir.mkdir(parents=True, exist_ok=True)
 end   = datetime.today()
 start = end - timedelta(days=365)
 
-success, failed = 0, 0
 
-for t in tickers:
+def fetch_one(t: str) -> int:
+    """Download one ticker and atomically write its CSV. Returns rows written."""
     ticker = t.lower()
-    try:
-        logger.info(f"Fetching data for {ticker}")
-        df = yf.download(t, start=start, end=end, progress=False)
-        if df.empty:
-            logger.warning(f"No data returned for {ticker}")
-            failed += 1
-            continue
-
-        df.reset_index(inplace=True)
-        df = df.rename(columns={
-            "Date": "date", "Open": "open", "High": "high",
-            "Low": "low", "Close": "close", "Volume": "volume"
-        })
-        df["ticker"] = ticker
-        df = df[["ticker", "date", "open", "high", "low", "close", "volume"]]
-
-        temp_path = raw_dir / f"{ticker}.csv.tmp"
-        out_path  = raw_dir / f"{ticker}.csv"
-        df.to_csv(temp_path, index=False)
-        temp_path.rename(out_path)
-
-        logger.info(f"Saved {len(df)} rows to {out_path}")
-        success += 1
-
-    except Exception as e:
-        logger.error(f"Failed to fetch {ticker}: {e}", exc_info=True)
-        failed += 1
-
-logger.info(f"Fetch complete: {success} succeeded, {failed} failed.")
\ No newline at end of file
+    logger.info(f"Fetching data for {ticker}")
+    df = yf.download(t, start=start, end=end, progress=False, threads=False)
+    if df.empty:
+        logger.warning(f"No data returned for {ticker}")
+        return 0
+
+    df.reset_index(inplace=True)
+    df = df.rename(columns={
+        "Date": "date", "Open": "open", "High": "high",
+        "Low": "low", "Close": "close", "Volume": "volume"
+    })
+    df["ticker"] = ticker
+    df = df[["ticker", "date", "open", "high", "low", "close", "volume"]]
+
+    temp_path = raw_dir / f"{ticker}.csv.tmp"
+    out_path  = raw_dir / f"{ticker}.csv"
+    df.to_csv(temp_path, index=False)
+    temp_path.rename(out_path)
+
+    logger.info(f"Saved {len(df)} rows to {out_path}")
+    return len(df)
+
+
+def fetch_all():
+    """Fetch all configured tickers concurrently (network-bound, thread-friendly)."""
+    success, failed = 0, 0
+
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as ex:
+        futures = {ex.submit(fetch_one, t): t for t in tickers}
+        for future in as_completed(futures):
+            t = futures[future]
+            try:
+                if future.result() > 0:
+                    success += 1
+                else:
+                    failed += 1
+            except Exception as e:
+                logger.error(f"Failed to fetch {t}: {e}", exc_info=True)
+                failed += 1
+
+    logger.info(f"Fetch complete: {success} succeeded, {failed} failed.")
+
+
+if __name__ == "__main__":
+    fetch_all()
@@ -7,16 +7,33 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+class _SubheaderFilter:
+    """
+    Minimal file-like reader that drops yfinance's sub-header row (the
+    second line, ",,AAPL,AAPL,..." — empty ticker and date) while streaming
+    a raw CSV. Data rows always begin with the ticker and the header with
+    "ticker", so any line starting with a comma is junk; PostgreSQL would
+    otherwise reject its "AAPL" under the DECIMAL columns.
+    """
+
+    def __init__(self, f):
+        self._lines = (line for line in f if not line.startswith(","))
+
+    def read(self, size: int = -1) -> str:
+        out, n = [], 0
+        for line in self._lines:
+            out.append(line)
+            n += len(line)
+            if 0 <= size <= n:
+                break
+        return "".join(out)
+
 def load_to_postgres():
     cfg     = load_config()
     raw_dir = Path(cfg["paths"]["raw_data"])
     engine  = get_engine(echo=False)
     table   = "marketpulse.stg_stocks"
 
-    logger.info(f"Truncating table {table}")
-    with engine.begin() as conn:
-        conn.execute(text(f"TRUNCATE TABLE {table};"))
-
     csv_files = list(raw_dir.glob("*.csv"))
     if not csv_files:
         logger.warning(f"No CSV files found in {raw_dir}")
@@ -24,53 +41,43 @@ def load_to_postgres():
 
     expected = ["ticker","date","open","high","low","close","volume"]
 
-    for csv_path in csv_files:
-        try:
+    copy_sql = (
+        f"COPY {table} (ticker, date, open, high, low, close, volume) "
+        "FROM STDIN WITH (FORMAT CSV, HEADER true)"
+    )
+
+    # TRUNCATE and every COPY share one transaction: a single commit fsync
+    # instead of one per file, and a failed load leaves the table untouched.
+    with engine.begin() as conn:
+        logger.info(f"Truncating table {table}")
+        conn.execute(text(f"TRUNCATE TABLE {table};"))
+
+        cur = conn.connection.cursor()
+        for csv_path in csv_files:
             logger.info(f"Reading {csv_path.name}")
-            df = pd.read_csv(csv_path)
 
-            df.columns = [c.strip().lower() for c in df.columns]
+            # Cheap schema check on a few rows; fetch_data writes the columns
+            # in exactly this order, so the file itself can be streamed as-is.
+            sample = pd.read_csv(csv_path, nrows=5)
+            sample.columns = [c.strip().lower() for c in sample.columns]
 
-            missing_cols = set(expected) - set(df.columns)
+            missing_cols = set(expected) - set(sample.columns)
             if missing_cols:
                 logger.error(f"Missing columns in {csv_path.name}: {missing_cols}")
                 continue
 
-            df = df[expected]
-
-            df["date"] = pd.to_datetime(df["date"])
-            df["ticker"] = df["ticker"].astype(str)
-           
-            numeric_cols = ["open", "high", "low", "close", "volume"]
-            for col in numeric_cols:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-
-            before = len(df)
-            df.dropna(how="all", inplace=True)
-            dropped = before - len(df)
-            if dropped:
-                logger.info(f"Dropped {dropped} empty rows from {csv_path.name}")
-
-            logger.info(f"DataFrame dtypes: {df.dtypes.to_dict()}")
-            logger.info(f"Sample data: {df.head(1).to_dict('records')}")
-
-            df.to_sql(
-                name="stg_stocks",
-                schema="marketpulse",
-                con=engine,
-                if_exists="append",
-                index=False,
-                method="multi",
-                chunksize=5000
-            )
-            logger.info(f"Loaded {len(df)} rows from {csv_path.name}")
-
-        except Exception as e:
-            logger.error(f"Failed loading {csv_path.name}: {e}", exc_info=True)
-            if 'df' in locals():
-                logger.error(f"DataFrame shape: {df.shape}")
-                logger.error(f"DataFrame columns: {list(df.columns)}")
-                logger.error(f"DataFrame dtypes: {df.dtypes.to_dict()}")
+            # Stream the file straight into PostgreSQL — COPY parses the rows
+            # server-side, so no DataFrame is ever materialized. The filter
+            # strips the yfinance sub-header row on the fly.
+            with open(csv_path, "r", encoding="utf-8", newline="") as f:
+                reader = _SubheaderFilter(f)
+                if hasattr(cur, "copy_expert"):  # psycopg2
+                    cur.copy_expert(copy_sql, reader)
+                else:  # psycopg3
+                    with cur.copy(copy_sql) as copy:
+                        while chunk := reader.read(1 << 16):
+                            copy.write(chunk)
+            logger.info(f"Loaded {cur.rowcount} rows from {csv_path.name}")
 
 if __name__ == "__main__":
     load_to_postgres()
\ No newline at end of file
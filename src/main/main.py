@@ -13,8 +13,8 @@ def main():
 
     project_root = Path(__file__).parent.parent.parent 
     raw_dir = project_root / 'data' / 'raw'
-    clean_output = project_root / "data" / "staged" / "clean_stocks.csv"
-    processed_output = project_root / "data" / "staged" / "processed_stocks.csv"
+    clean_output = project_root / "data" / "staged" / "clean_stocks.parquet"
+    processed_output = project_root / "data" / "staged" / "processed_stocks.parquet"
     forecast_dir = project_root / "data" / "staged" / "forecasts"
 
     logger.info(f"Project root: {project_root}")
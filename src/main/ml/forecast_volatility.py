@@ -3,8 +3,11 @@ GARCH volatility forecasting module for stock market data.
 Fits GARCH(1,1) models and generates volatility forecasts.
 """
 
+import logging
+import os
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 import warnings
@@ -46,13 +49,17 @@ def fit_garch_model(returns: pd.Series, ticker: str, dist: 'str' = 'normal') ->
     
     try:
         model = arch_model(clean_returns, vol='Garch', p=1, q=1, dist=dist)
-        fitted_model = model.fit(disp='off')
-        
+        # Cap solver iterations so one pathological series can't dominate the
+        # total fitting time; update_freq=0 suppresses per-iteration output.
+        fitted_model = model.fit(disp='off', update_freq=0,
+                                 options={'maxiter': 100, 'ftol': 1e-6})
+
+        if fitted_model.convergence_flag != 0:
+            logger.warning('%s: GARCH fit hit the iteration cap (convergence flag %s)',
+                           ticker.upper(), fitted_model.convergence_flag)
+
         params = fitted_model.params
-        
-        forecasts = fitted_model.forecast(horizon=5)
-        forecasted_vols = forecasts.variance.iloc[-1].values ** 0.5 / 100
-        
+
         results = {
             'ticker': ticker,
             'model': fitted_model,
@@ -63,12 +70,17 @@ def fit_garch_model(returns: pd.Series, ticker: str, dist: 'str' = 'normal') ->
             'alpha': params.get('alpha[1]', np.nan),
             'beta': params.get('beta[1]', np.nan),
             'persistence': params.get('alpha[1]', 0) + params.get('beta[1]', 0),
+            'convergence_flag': fitted_model.convergence_flag,
             'conditional_volatility': fitted_model.conditional_volatility,
             'returns_used': clean_returns,
+            'last_date': clean_returns.index[-1],
             'n_observations': len(clean_returns)
         }
 
-        logger.info(f'{ticker.upper()}: AIC={fitted_model.aic:.2f}, 'f'Persistence={results["persistence"]:.4f}')
+        # Lazy %-formatting: the floats are only interpolated if a handler
+        # actually wants the record.
+        logger.info('%s: AIC=%.2f, Persistence=%.4f',
+                    ticker.upper(), fitted_model.aic, results['persistence'])
         
         return results
     
@@ -97,14 +109,19 @@ def generate_volatility_forecasts(garch_results: Dict, horizon: int = 14) -> pd.
     ticker = garch_results['ticker']
 
     try:
-        logger.info(f'Generating {horizon}-day volatility forecast for {ticker.upper()}')
+        logger.info('Generating %d-day volatility forecast for %s', horizon, ticker.upper())
 
-        forecast = model.forecast(horizon=horizon, method='simulation', simulations=1000)
+        # GARCH(1,1) has a closed-form multi-step variance recursion, so the
+        # analytic forecast gives the same conditional-variance path as the
+        # 1000-path simulation at a tiny fraction of the cost.
+        forecast = model.forecast(horizon=horizon, method='analytic', reindex=False)
 
         forecast_variance = forecast.variance.iloc[-1]
         forecast_volatility = np.sqrt(forecast_variance)
 
-        last_date = pd.Timestamp.today()
+        # Anchor the forecast to the last in-sample date captured at fit time,
+        # not the wall clock — keeps forecast_date aligned with the data.
+        last_date = garch_results['last_date']
         forecast_dates = pd.bdate_range(start=last_date + pd.Timedelta(days=1), periods=horizon, freq='B')
 
         forecast_df = pd.DataFrame({
@@ -115,8 +132,10 @@ def generate_volatility_forecasts(garch_results: Dict, horizon: int = 14) -> pd.
             'forecast_horizon': np.arange(1, horizon + 1)
         })
 
-        logger.info(f"{ticker.upper()}: Generated {len(forecast_df)} day forecast, "
-                   f"avg volatility {forecast_df['forecast_volatility'].mean():.4f}%")
+        # The mean() is only worth computing when the record will be emitted.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"{ticker.upper()}: Generated {len(forecast_df)} day forecast, "
+                       f"avg volatility {forecast_df['forecast_volatility'].mean():.4f}%")
         
         return forecast_df
     
@@ -124,13 +143,38 @@ def generate_volatility_forecasts(garch_results: Dict, horizon: int = 14) -> pd.
         logger.error(f"Forecast generation failed for {ticker}: {e}")
         return pd.DataFrame()
 
-def process_all_tickers_garch(input_file: Path, output_dir: Path, 
+def _fit_and_forecast(ticker: str, returns: np.ndarray, dates: np.ndarray,
+                      horizon: int) -> Tuple[Optional[dict], Optional[pd.DataFrame]]:
+    """
+    Worker for process-parallel GARCH fitting: fit one ticker and forecast.
+
+    Module-level (not a closure) so ProcessPoolExecutor can pickle it; takes
+    plain numpy arrays and returns only scalars plus the forecast frame, so
+    the cross-process payload stays small.
+    """
+    series = pd.Series(returns, index=pd.DatetimeIndex(dates))
+
+    garch_results = fit_garch_model(series, ticker, dist='normal')
+    if garch_results is None:
+        return None, None
+
+    forecast_df = generate_volatility_forecasts(garch_results, horizon)
+
+    # The ARCHModelResult (and its data copies) stay worker-local; only the
+    # summary scalars cross the pickle boundary back to the parent.
+    summary = {key: garch_results[key] for key in (
+        'ticker', 'aic', 'bic', 'loglikelihood', 'omega', 'alpha', 'beta',
+        'persistence', 'convergence_flag', 'last_date', 'n_observations')}
+    return summary, forecast_df
+
+
+def process_all_tickers_garch(input_file: Path, output_dir: Path,
                              forecast_horizon: int = 14) -> Dict[str, Dict]:
     """
     Fit GARCH models and generate forecasts for all tickers.
     
     Args:
-        input_file: Path to processed stock data CSV
+        input_file: Path to processed stock data Parquet file
         output_dir: Directory where forecast files will be saved
         forecast_horizon: Number of days ahead to forecast
         
@@ -145,45 +189,84 @@ def process_all_tickers_garch(input_file: Path, output_dir: Path,
     
     logger.info(f"Starting GARCH analysis from {input_file}")
     
-    df = pd.read_csv(input_file)
-    df['date'] = pd.to_datetime(df['date'])
-    
+    # Only three of the staged columns are used here; column-pruned Parquet
+    # reads skip the OHLCV and cumulative metric columns entirely.
+    df = pd.read_parquet(input_file, engine='pyarrow',
+                         columns=['ticker', 'date', 'daily_return'])
+
     tickers = df['ticker'].unique()
     logger.info(f"Processing GARCH models for {len(tickers)} tickers: {list(tickers)}")
-    
+
     output_dir.mkdir(parents=True, exist_ok=True)
-    
+
     all_results = {}
-    all_forecasts = []
-    
-    for ticker in tickers:
-        try:
-            ticker_data = df[df['ticker'] == ticker].sort_values('date')
-            returns = ticker_data['daily_return']
-            
-            garch_results = fit_garch_model(returns, ticker, dist='normal')
-            
-            if garch_results is None:
-                logger.warning(f"Skipping forecast for {ticker} due to fitting failure")
-                continue
-            
-            all_results[ticker] = garch_results
-            
-            forecast_df = generate_volatility_forecasts(garch_results, forecast_horizon)
-            
-            if not forecast_df.empty:
-                forecast_file = output_dir / f"{ticker}_garch_forecast.csv"
-                forecast_df.to_csv(forecast_file, index=False)
-                logger.info(f"Saved forecast: {forecast_file}")
-                
-                all_forecasts.append(forecast_df)
-            
-        except Exception as e:
-            logger.error(f"Failed to process {ticker}: {e}")
+
+    # Accumulate the combined output as raw column arrays: one DataFrame
+    # construction at the end instead of concat over many tiny 14-row frames.
+    tickers_out, dates_out, vols_out, vars_out, horizons_out = [], [], [], [], []
+
+    # Each GARCH fit is an independent CPU-bound optimization, so fan the
+    # tickers out across processes; only numpy arrays cross the boundary.
+    per_ticker = {
+        ticker: (g['daily_return'].to_numpy(), g['date'].to_numpy())
+        for ticker, g in df.sort_values(['ticker', 'date']).groupby('ticker', sort=False)
+    }
+
+    # A valid but empty input (zero rows) means zero workers; bail out before
+    # ProcessPoolExecutor rejects max_workers=0.
+    if not per_ticker:
+        logger.warning(f"No ticker data found in {input_file}; nothing to fit")
+        return all_results
+
+    fitted = {}
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(per_ticker))) as ex:
+        futures = {
+            ex.submit(_fit_and_forecast, ticker, returns, dates, forecast_horizon): ticker
+            for ticker, (returns, dates) in per_ticker.items()
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                fitted[ticker] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to process {ticker}: {e}")
+
+    # Walk tickers in their original order so output files are deterministic.
+    for ticker in per_ticker:
+        garch_results, forecast_df = fitted.get(ticker, (None, None))
+
+        if garch_results is None:
+            logger.warning(f"Skipping forecast for {ticker} due to fitting failure")
             continue
-    
-    if all_forecasts:
-        combined_forecasts = pd.concat(all_forecasts, ignore_index=True)
+
+        all_results[ticker] = garch_results
+
+        # The queue listener lives only in the parent process, so records the
+        # workers emitted inside fit_garch_model never reach it — re-raise the
+        # iteration-cap warning here from the returned convergence flag.
+        if garch_results['convergence_flag'] != 0:
+            logger.warning('%s: GARCH fit hit the iteration cap (convergence flag %s)',
+                           ticker.upper(), garch_results['convergence_flag'])
+
+        if forecast_df is not None and not forecast_df.empty:
+            forecast_file = output_dir / f"{ticker}_garch_forecast.csv"
+            forecast_df.to_csv(forecast_file, index=False)
+            logger.info(f"Saved forecast: {forecast_file}")
+
+            tickers_out.extend([ticker] * len(forecast_df))
+            dates_out.append(forecast_df['forecast_date'].to_numpy())
+            vols_out.append(forecast_df['forecast_volatility'].to_numpy())
+            vars_out.append(forecast_df['forecast_variance'].to_numpy())
+            horizons_out.append(forecast_df['forecast_horizon'].to_numpy())
+
+    if tickers_out:
+        combined_forecasts = pd.DataFrame({
+            'ticker': pd.Categorical(tickers_out),
+            'forecast_date': np.concatenate(dates_out),
+            'forecast_volatility': np.concatenate(vols_out),
+            'forecast_variance': np.concatenate(vars_out),
+            'forecast_horizon': np.concatenate(horizons_out),
+        })
         combined_file = output_dir / "all_tickers_garch_forecasts.csv"
         combined_forecasts.to_csv(combined_file, index=False)
         logger.info(f"Saved combined forecasts: {combined_file}")
@@ -210,8 +293,8 @@ def process_all_tickers_garch(input_file: Path, output_dir: Path,
         
         logger.info("GARCH Model Summary:")
         for _, row in comparison_df.iterrows():
-            logger.info(f"{row['ticker']}: AIC={row['aic']:.2f}, "
-                       f"Persistence={row['persistence']:.4f}")
+            logger.info('%s: AIC=%.2f, Persistence=%.4f',
+                        row['ticker'], row['aic'], row['persistence'])
     
     logger.info(f"GARCH analysis completed: {len(all_results)} models fitted")
     return all_results
@@ -232,7 +315,7 @@ def validate_garch_results(garch_results: Dict) -> Dict[str, Dict]:
     for ticker, results in garch_results.items():
         validation = {
             'ticker': ticker,
-            'model_converged': results['model'].convergence_flag if hasattr(results['model'], 'convergence_flag') else True,
+            'model_converged': results.get('convergence_flag', 0) == 0,
             'persistence_stable': results['persistence'] < 1.0,  
             'alpha_significant': results['alpha'] > 0.01, 
             'beta_significant': results['beta'] > 0.01,   
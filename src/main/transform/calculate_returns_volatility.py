@@ -21,10 +21,16 @@ def calculate_financial_metrics(df: pd.DataFrame, price_col: str = 'close', wind
         df: DataFrame with OHLCV data for one ticker
         price_col: Column name to use for price calculations
         window: Rolling window size for volatility calculation
-        
+
     Returns:
         DataFrame with added financial metrics
-        
+
+    Note:
+        The input frame is left untouched — sort_values returns a fresh frame
+        and all columns are added to that copy. Kept as the single-ticker
+        reference implementation; the pipeline itself uses the vectorized
+        grouped path in process_all_tickers.
+
     Raises:
         ValueError: If required columns are missing
     """
@@ -33,13 +39,11 @@ def calculate_financial_metrics(df: pd.DataFrame, price_col: str = 'close', wind
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
         raise ValueError(f'Missing required columns: {missing_cols}')
-    
+
     if df.empty:
         raise  ValueError('Input DataFrame is empty')
-    
-    result_df = df.copy()
 
-    result_df = result_df.sort_values('date').reset_index(drop=True)
+    result_df = df.sort_values('date').reset_index(drop=True)
 
     result_df['daily_return'] = np.log(result_df[price_col] / result_df[price_col].shift(1))
 
@@ -58,7 +62,7 @@ def process_all_tickers(input_file: Path, output_file: Path, price_col: str = 'c
     Process financial metrics for all tickers in a combined dataset.
     
     Args:
-        input_file: Path to cleaned stock data CSV
+        input_file: Path to cleaned stock data Parquet file
         output_file: Path where processed data will be saved
         price_col: Column name to use for price calculations
         window: Rolling window size for volatility calculation
@@ -75,60 +79,54 @@ def process_all_tickers(input_file: Path, output_file: Path, price_col: str = 'c
     
     logger.info(f'Reading cleaned data from {input_file}')
 
-    df = pd.read_csv(input_file)
+    # Parquet deserializes typed columns (dates included) with no text parse.
+    df = pd.read_parquet(input_file, engine='pyarrow')
+
+    if 'ticker' in df.columns:
+        df['ticker'] = df['ticker'].astype('category')
 
     if df.empty:
-        raise ValueError('Input CSV is empty')
-    
+        raise ValueError('Input file is empty')
+
     required_cols = ['ticker', 'date', price_col]
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
         raise ValueError(f'Missing required columns: {missing_cols}')
-    
-    df['date'] = pd.to_datetime(df['date'], errors='coerce')
 
     tickers = df['ticker'].unique()
     logger.info(f'Processing {len(tickers)} tickers: {list(tickers)}')
 
-    processed_dataframes = []
-    failed_tickers = []
-
-    for ticker in tickers:
-        try:
-            logger.info(f'Calculating metrics for {ticker.upper()}')
-            ticker_data = df[df['ticker'] == ticker].copy()
-
-            if ticker_data.empty:
-                logger.warning(f'No data found for ticker: {ticker}')
-                failed_tickers.append(ticker)
-                continue
-
-            processed_ticker = calculate_financial_metrics(ticker_data, price_col=price_col, window=window)
-            processed_dataframes.append(processed_ticker)
-
-            valid_returns = processed_ticker['daily_return'].dropna()
-            if len(valid_returns) > 0:
-                logger.info(f'{ticker.upper()}: {len(valid_returns)} valid returns,' f'mean daily return: {valid_returns.mean():.6f}')
-            else:
-                logger.warning(f'{ticker.upper()}: No valid returns calculated.')
-        except Exception as e:
-            logger.error(f'Failed to process {ticker}: {e}')
-            failed_tickers.append(ticker)
-    
-    if not processed_dataframes:
-        raise ValueError('No valid tickers processed successfully.')
-    
-    logger.info(f'Combining processed data for all tickers')
-    combined_df = pd.concat(processed_dataframes, ignore_index=True, sort=False)
+    # One vectorized pass over the whole frame: grouped shift/rolling/cumprod
+    # run inside NumPy's C layer instead of T separate per-ticker invocations.
+    logger.info('Calculating metrics for all tickers in a single pass')
+    combined_df = df.sort_values(['ticker', 'date']).reset_index(drop=True)
+
+    combined_df['daily_return'] = np.log(
+        combined_df[price_col] / combined_df.groupby('ticker', sort=False)[price_col].shift(1)
+    )
+
+    # Calculate rolling volatility (annualized)
+    # Standard deviation of returns over rolling window, annualized by sqrt(252 trading days)
+    combined_df[f'volatility_{window}d'] = combined_df.groupby('ticker', sort=False)['daily_return'].transform(
+        lambda x: x.rolling(window=window, min_periods=window).std()
+    ) * np.sqrt(252)
 
-    combined_df = combined_df.sort_values(['ticker', 'date']).reset_index(drop=True)
+    combined_df['simple_return'] = combined_df.groupby('ticker', sort=False)[price_col].pct_change()
+
+    combined_df['cumulative_return'] = combined_df.groupby('ticker', sort=False)['simple_return'].transform(
+        lambda x: (1 + x).cumprod() - 1
+    )
+
+    for ticker, valid_count in combined_df.groupby('ticker', sort=False)['daily_return'].count().items():
+        if valid_count == 0:
+            logger.warning('%s: No valid returns calculated.', ticker.upper())
 
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    combined_df.to_csv(output_file, index=False)
-    
+    combined_df.to_parquet(output_file, engine='pyarrow', compression='zstd', index=False)
+
     total_rows = len(combined_df)
-    successful_tickers = len(processed_dataframes)
+    successful_tickers = len(tickers)
     date_range = f'{combined_df["date"].min()} to {combined_df["date"].max()}'
 
     returns_na = combined_df['daily_return'].isna().sum()
@@ -140,9 +138,6 @@ def process_all_tickers(input_file: Path, output_file: Path, price_col: str = 'c
     logger.info(f'Missing values - Daily returns: {returns_na}, Volatility: {volatility_na}')
     logger.info(f'Saved t0: {output_file}')
 
-    if failed_tickers:
-        logger.warning(f'Failed to process {len(failed_tickers)} tickers: {failed_tickers}')
-
     return combined_df
 
 def validate_financial_data(df: pd.DataFrame, price_col: str = 'close') -> dict:
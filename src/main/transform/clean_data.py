@@ -3,7 +3,9 @@ Data cleaning module for stock market data.
 Converts raw csv files to cleaned standardized format.
 """
 
+import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import logging
 from typing import List, Optional
@@ -29,29 +31,29 @@ def clean_stock_data(csv_path: Path) -> pd.DataFrame:
     if not csv_path.exists():
         raise FileNotFoundError(f'CSV file not found: {csv_path}')
     
-    logger.info(f'Cleaning {csv_path.name}')
+    logger.info('Cleaning %s', csv_path.name)
 
-    df = pd.read_csv(csv_path)
+    # Typed single-pass parse: ticker and date get their dtypes inside the
+    # C parser instead of a second to_datetime walk over the frame.
+    df = pd.read_csv(csv_path, dtype={'ticker': 'string'}, parse_dates=['date'])
     original_rows = len(df)
 
     expected_cols = ['ticker', 'date', 'open', 'high', 'low', 'close', 'volume']
     missing_cols = [col for col in expected_cols if col not in df.columns]
     if missing_cols:
         raise ValueError(f'Missing expected columns in {csv_path.name}: {missing_cols}')
-    
-    df = df.dropna(subset=expected_cols)
 
+    if not pd.api.types.is_datetime64_any_dtype(df['date']):
+        logger.error(f'Failed to convert date column in {csv_path.name}')
+        raise ValueError(f'Invalid date format in {csv_path.name}')
+
+    # yfinance leaves a stray sub-header row in the raw files, so the price
+    # columns must be coerced (strict dtypes in read_csv would raise on it).
     price_cols = ['open', 'high', 'low', 'close', 'volume']
     for col in price_cols:
         df[col] = pd.to_numeric(df[col], errors='coerce')
 
-    try:
-        df['date'] = pd.to_datetime(df['date'])
-    except Exception as e:
-        logger.error(f'Failed to convert date column in {csv_path.name}: {e}')
-        raise ValueError(f'Invalid date format in {csv_path.name}')
-
-    df = df.dropna()
+    df = df.dropna(subset=expected_cols)
 
     df = df.sort_values('date').reset_index(drop=True)
 
@@ -65,7 +67,9 @@ def clean_stock_data(csv_path: Path) -> pd.DataFrame:
         if drop_pct > 10:
             logger.error(f'High data loss in {csv_path.name}: {drop_pct:.1f}% - check data quality')
 
-    logger.info(f'Cleaned {csv_path.name}: {final_rows} rows, date range {df['date'].min()} to {df['date'].max()}')
+    # The date min/max scans are only worth doing if the record is emitted.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f'Cleaned {csv_path.name}: {final_rows} rows, date range {df["date"].min()} to {df["date"].max()}')
     return df
 
 def clean_all_stocks(input_dir: Path, output_file: Path) -> pd.DataFrame:
@@ -97,28 +101,39 @@ def clean_all_stocks(input_dir: Path, output_file: Path) -> pd.DataFrame:
     cleaned_dataframes = []
     failed_files = []
 
-    for csv_path in sorted(csv_files):
-        try:
-            cleaned_df = clean_stock_data(csv_path)
-            if not cleaned_df.empty:
-                cleaned_dataframes.append(cleaned_df)
-            else:
-                logger.warning(f'No valid data after cleaning: {csv_path.name}')
+    # Each file is independent I/O plus a small amount of CPU, and pandas
+    # releases the GIL during the C-engine parse, so threads overlap the work.
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        futures = {ex.submit(clean_stock_data, p): p for p in sorted(csv_files)}
+        for future in as_completed(futures):
+            csv_path = futures[future]
+            try:
+                cleaned_df = future.result()
+                if not cleaned_df.empty:
+                    cleaned_dataframes.append(cleaned_df)
+                else:
+                    logger.warning(f'No valid data after cleaning: {csv_path.name}')
+                    failed_files.append(csv_path.name)
+            except Exception as e:
+                logger.error(f'Failed to clean {csv_path.name}: {e}')
                 failed_files.append(csv_path.name)
-        except Exception as e:
-            logger.error(f'Failed to clean {csv_path.name}: {e}')
-            failed_files.append(csv_path.name)
 
     if not cleaned_dataframes:
         raise ValueError('No files could be successfully cleaned.')
     
     combined_df = pd.concat(cleaned_dataframes, ignore_index=True, sort=False)
 
+    # Categorical ticker: integer codes instead of one string object per row,
+    # and Parquet round-trips the dictionary encoding natively.
+    combined_df['ticker'] = combined_df['ticker'].astype('category')
+
     combined_df = combined_df.sort_values(['ticker', 'date']).reset_index(drop=True)
 
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    combined_df.to_csv(output_file, index=False)
+    # Parquet keeps the columns typed (no string->float reparse downstream)
+    # and zstd roughly halves the bytes on disk.
+    combined_df.to_parquet(output_file, engine='pyarrow', compression='zstd', index=False)
 
     total_rows = len(combined_df)
     unique_tickers = combined_df['ticker'].nunique()
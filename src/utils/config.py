@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 import os
@@ -6,9 +7,10 @@ env_path = Path(__file__).parent.parent.parent / "config" / ".env"
 load_dotenv(dotenv_path=env_path)
 
 
+@lru_cache(maxsize=1)
 def load_config():
     """Reads environment variables from the loaded .env file.
-    and returns a Python dictionary of settings"""
+    and returns a Python dictionary of settings (parsed once per process)"""
     return {
         "postgres": {
             "user":     os.getenv("POSTGRES_USER"),   
@@ -16,6 +18,17 @@ def load_config():
             "host":     os.getenv("POSTGRES_HOST"),
             "port":     os.getenv("POSTGRES_PORT", "5432"),
             "db":       os.getenv("POSTGRES_DB"),
+            "driver":   os.getenv("POSTGRES_DRIVER", "postgresql+psycopg"),
+        },
+        "pool": {
+            key: int(value)
+            for key, value in {
+                "pool_size":    os.getenv("POSTGRES_POOL_SIZE"),
+                "max_overflow": os.getenv("POSTGRES_MAX_OVERFLOW"),
+                "pool_timeout": os.getenv("POSTGRES_POOL_TIMEOUT"),
+                "pool_recycle": os.getenv("POSTGRES_POOL_RECYCLE"),
+            }.items()
+            if value is not None
         },
         "tickers": os.getenv("TICKERS", "").split(","),
         "paths": {
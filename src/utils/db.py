@@ -1,16 +1,231 @@
+import contextlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+
 from sqlalchemy import create_engine
-from urllib.parse import quote_plus
-from .config import load_config 
+from sqlalchemy.engine import URL
+from sqlalchemy.pool import QueuePool
+from .config import load_config
+
+_engines = []
 
-def get_engine(echo: bool = False):
+@dataclass(frozen=True, slots=True)
+class PgConfig:
+    """Typed PostgreSQL connection settings (frozen, slot-based, hashable)."""
+    user: str
+    password: str
+    host: str
+    port: int
+    db: str
+    driver: str
+
+@lru_cache(maxsize=1)
+def _pg() -> PgConfig:
+    """Parse the postgres config section into a PgConfig, once per process."""
     cfg = load_config()["postgres"]
-    
-    user     = cfg["user"]
-    password = quote_plus(cfg["password"]) 
-    host     = cfg["host"]
-    port     = cfg["port"]
-    db       = cfg["db"]
+    return PgConfig(
+        user=cfg["user"],
+        password=cfg["password"],
+        host=cfg["host"],
+        port=int(cfg["port"]),
+        db=cfg["db"],
+        driver=cfg.get("driver", "postgresql+psycopg"),
+    )
+
+@lru_cache(maxsize=8)
+def _build_engine(echo: bool, pool_size: int, max_overflow: int,
+                  pool_timeout: int, pool_recycle: int, pool_pre_ping: bool):
+    """Build (once per distinct settings) the engine and its pool."""
+    cfg = _pg()
+
+    # URL.create handles escaping itself (passwords with @/:, IPv6 hosts),
+    # so no manual quote_plus and no URL string for SQLAlchemy to re-parse.
+    # The driver is configurable so operators can A/B psycopg2 vs psycopg3.
+    connection_url = URL.create(
+        drivername=cfg.driver,
+        username=cfg.user,
+        host=cfg.host,
+        port=cfg.port,
+        database=cfg.db,
+    )
+
+    # The password rides in connect_args instead of the URL, so the Engine
+    # (whose URL gets repr'd and stringified) never carries the secret and
+    # no full-DSN string is allocated per build.
+    #
+    # TCP keepalives detect half-open connections (NAT/firewall idle drops)
+    # in ~60s instead of hanging on the kernel default; a tight connect
+    # timeout fails fast when the server is unreachable, and the application
+    # name makes the pipeline's sessions identifiable in pg_stat_activity.
+    connect_args = {
+        "password": cfg.password,
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 3,
+        "connect_timeout": 5,
+        "application_name": "market_pulse",
+    }
+
+    # psycopg3 speaks the binary protocol and auto-prepares statements that
+    # repeat past the threshold, skipping parse/plan on later executions.
+    if cfg.driver == "postgresql+psycopg":
+        connect_args["prepare_threshold"] = 5
+
+    engine = create_engine(
+        connection_url,
+        echo=echo,
+        connect_args=connect_args,
+        # Roomy compiled-SQL cache: repeated statement constructs skip the
+        # pure-Python compile step, which dominates small-query overhead.
+        query_cache_size=1200,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+    )
+    _engines.append(engine)
+    return engine
+
+def get_engine(echo: bool = False, pool_size: int = 10, max_overflow: int = 20,
+               pool_timeout: int = 30, pool_recycle: int = 1800,
+               pool_pre_ping: bool = True):
+    """
+    Return the process-wide SQLAlchemy engine for these settings. The engine
+    (and its tuned connection pool) is built on first call and memoized, so
+    callers can invoke this per-operation without thrashing connections.
+    Pool settings can be overridden per-deployment via the optional "pool"
+    section of the config (POSTGRES_POOL_* env vars).
+    """
+    pool_cfg = load_config().get("pool", {})
+
+    return _build_engine(
+        echo,
+        pool_cfg.get("pool_size", pool_size),
+        pool_cfg.get("max_overflow", max_overflow),
+        pool_cfg.get("pool_timeout", pool_timeout),
+        pool_cfg.get("pool_recycle", pool_recycle),
+        pool_pre_ping,
+    )
+
+@lru_cache(maxsize=1)
+def get_async_engine(pool_size: int = 20, max_overflow: int = 40):
+    """
+    Async engine for read-heavy query paths (many small parallel SELECTs).
+    asyncpg speaks PostgreSQL's binary protocol natively and overlaps the
+    round trips, where the sync psycopg stack serializes them. Ingestion
+    keeps using the sync engine from get_engine().
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    cfg = _pg()
+
+    url = URL.create(
+        drivername="postgresql+asyncpg",
+        username=cfg.user,
+        password=cfg.password,
+        host=cfg.host,
+        port=cfg.port,
+        database=cfg.db,
+    )
+
+    return create_async_engine(url, pool_size=pool_size, max_overflow=max_overflow)
+
+@lru_cache(maxsize=1)
+def _raw_pool():
+    """Lazily build the driver-level psycopg pool (first get_raw_conn call)."""
+    from psycopg.conninfo import make_conninfo
+    from psycopg_pool import ConnectionPool
+
+    cfg = _pg()
+
+    # make_conninfo applies libpq quoting (values with spaces/quotes), and
+    # the password stays out of the string entirely — it rides in the
+    # per-connect kwargs, mirroring the engine's connect_args handling.
+    conninfo = make_conninfo(
+        host=cfg.host, port=cfg.port, dbname=cfg.db, user=cfg.user,
+        connect_timeout=5, application_name="market_pulse",
+    )
+
+    # prepare_threshold=1: the second execution of any statement is already
+    # server-side prepared, so repeated batch inserts skip parse/plan.
+    pool = ConnectionPool(conninfo, min_size=4, max_size=20,
+                          kwargs={"password": cfg.password, "prepare_threshold": 1},
+                          open=True)
+    return pool
+
+def get_raw_conn():
+    """
+    Check a psycopg (v3) connection out of a driver-level pool, bypassing
+    SQLAlchemy entirely — no compile/bind layer between the caller and the
+    wire protocol. For hot write paths:
+
+        with get_raw_conn() as conn, conn.cursor() as cur:
+            cur.executemany(insert_sql, rows)
+
+    The context manager commits on exit and returns the connection to the
+    pool; statements repeated across batches run server-side prepared.
+    """
+    return _raw_pool().connection()
+
+@contextlib.contextmanager
+def pooled_conn():
+    """
+    Check a connection out of the pool once and hand it to the caller:
+
+        with pooled_conn() as conn:
+            conn.execute(s1)
+            conn.execute(s2)
+
+    Running several statements on one checkout amortizes the pool
+    bookkeeping (and any pre-ping round trip) across all of them, instead
+    of paying it per statement. The caller commits explicitly if needed;
+    use pooled_tx() for an all-or-nothing block.
+    """
+    conn = get_engine().connect()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+@contextlib.contextmanager
+def pooled_tx():
+    """
+    Like pooled_conn(), but the block runs in a single transaction that
+    commits on normal exit and rolls back on exception — one checkout and
+    one commit fsync for the whole batch.
+    """
+    with get_engine().begin() as conn:
+        yield conn
 
-    connection_url = f"postgresql://{user}:{password}@{host}:{port}/{db}"
+def bulk_copy(table: str, columns: list, rows: Iterable) -> None:
+    """
+    Bulk-insert rows into a table via COPY ... FROM STDIN: one protocol
+    round trip and no per-row parse/plan, so it beats executemany by an
+    order of magnitude or more for wide loads. Expects the psycopg (v3)
+    driver — the default — whose adaptive text COPY handles the value
+    conversion per row.
+    """
+    engine = get_engine()
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cur:
+            cols = ", ".join(columns)
+            with cur.copy(f"COPY {table} ({cols}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+        raw.commit()
+    finally:
+        raw.close()
 
-    return create_engine(connection_url, echo=echo)
\ No newline at end of file
+def engine_dispose():
+    """Dispose all cached engines and pools, reset caches (test teardown)."""
+    _build_engine.cache_clear()
+    while _engines:
+        _engines.pop().dispose()
+    if _raw_pool.cache_info().currsize:
+        _raw_pool().close()
+        _raw_pool.cache_clear()